@@ -6,10 +6,17 @@ A GUI tool to find save game folders for Steam games running through Proton on L
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+import functools
+import hashlib
+import heapq
 import json
+import logging
 import os
+import pickle
 import subprocess
+import sys
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 import urllib.request
 import urllib.error
 import urllib.parse
@@ -17,98 +24,148 @@ from pathlib import Path
 import time
 import argparse
 import re
-from html.parser import HTMLParser
+from array import array
+from html import unescape
+import zlib
 
-class PCGamingWikiParser(HTMLParser):
-    """Parse PC Gaming Wiki pages to extract save game locations"""
-    
-    def __init__(self):
-        super().__init__()
-        self.in_save_section = False
-        self.in_table_row = False
-        self.in_table_cell = False
-        self.current_cell_data = ""
-        self.current_row = []
-        self.save_locations = []
-        self.cell_count = 0
-        self.debug_sections = []
-        
-    def handle_starttag(self, tag, attrs):
-        # Look for save game data location section
-        if tag == "span":
-            for attr_name, attr_value in attrs:
-                if attr_name == "id" and attr_value:
-                    self.debug_sections.append(attr_value)
-                    if "save" in attr_value.lower() and "game" in attr_value.lower():
-                        print(f"[DEBUG] Found save section: {attr_value}")
-                        self.in_save_section = True
-                        
-        # Track table structure
-        elif tag == "tr" and self.in_save_section:
-            self.in_table_row = True
-            self.current_row = []
-            self.cell_count = 0
-            
-        elif tag == "td" and self.in_table_row:
-            self.in_table_cell = True
-            self.current_cell_data = ""
-            
-    def handle_endtag(self, tag):
-        if tag == "td" and self.in_table_cell:
-            self.in_table_cell = False
-            self.current_row.append(self.current_cell_data.strip())
-            self.cell_count += 1
-            
-        elif tag == "tr" and self.in_table_row:
-            self.in_table_row = False
-            print(f"[DEBUG] Processing table row: {self.current_row}")
-            # Process completed row - look for paths
-            if self.current_row:
-                # Check if this is a single-column table with just the path
-                if len(self.current_row) == 1:
-                    path = self.current_row[0]
-                    print(f"[DEBUG] Single column path: '{path}'")
-                    if path and not path.startswith("N/A") and ("%" in path or "steamapps" in path):
-                        path = path.replace("&lt;", "<").replace("&gt;", ">")
-                        
-                        # If path ends with a filename, get the directory
-                        if "\\" in path and not path.endswith("\\"):
-                            # Check if last part looks like a filename
-                            last_part = path.split("\\")[-1]
-                            if "." in last_part and not last_part.startswith("."):
-                                path = "\\".join(path.split("\\")[:-1])
-                                print(f"[DEBUG] Removed filename, using directory: {path}")
-                        
-                        print(f"[DEBUG] Adding save location: {path}")
-                        self.save_locations.append(path)
-                        
-                # Check traditional two-column format (system, path)
-                elif len(self.current_row) >= 2:
-                    system = self.current_row[0].lower() if self.current_row[0] else ""
-                    path = self.current_row[1] if len(self.current_row) > 1 else ""
-                    
-                    print(f"[DEBUG] Row system: '{system}', path: '{path}'")
-                    
-                    if ("windows" in system or "steam" in system) and path:
-                        # Clean up the path
-                        path = path.replace("&lt;", "<").replace("&gt;", ">")
-                        if path and not path.startswith("N/A"):
-                            print(f"[DEBUG] Adding save location: {path}")
-                            self.save_locations.append(path)
-                        
-        elif tag == "table" and self.in_save_section:
-            print(f"[DEBUG] End of save section table")
-            self.in_save_section = False  # End of save section
-            
-    def handle_data(self, data):
-        if self.in_table_cell:
-            self.current_cell_data += data
-    
-    def get_debug_info(self):
-        return {
-            "sections_found": self.debug_sections,
-            "save_locations": self.save_locations
-        }
+log = logging.getLogger(__name__)
+
+# Delimiters used to split game and folder names into words
+_SPLIT_RE = re.compile(r'[:\-\s\(\)]+')
+
+# Numbered save files (save01, slot1, etc.)
+_SAVE_NUM_RE = re.compile(r'(save|slot|profile)\d+')
+
+# File extensions and name fragments that suggest a file is save data
+_SAVE_EXTS = ('.sav', '.save', '.dat', '.xml', '.json', '.cfg', '.ini', '.sl2', '.ess', '.bak', '.vdf')
+_SAVE_PATTERN_RE = re.compile(r'save|profile|config|settings|user|slot|progress')
+
+# Name fragments common in game data folders
+_GAME_FOLDER_PATTERNS = (
+    'save', 'saves', 'savegame', 'savegames', 'savedata',
+    'config', 'settings', 'profile', 'profiles', 'user',
+    'data', 'game', 'local', 'steam'
+)
+
+# Folders that Wine/Proton or common runtimes create in AppData, never a game's own folder
+_IGNORED_APPDATA_DIRS = frozenset({
+    'Microsoft', 'Mozilla', 'Temp', 'Crashpad', 'Packages', 'CrashDumps',
+    'ConnectedDevicesPlatform', 'PackageCache', 'NuGet', 'Adobe', 'Google'
+})
+
+# Windows folder variables that start wiki save paths, and where each lives in a Proton prefix
+_WINE_VAR_DIRS = {
+    'APPDATA': os.path.join("pfx", "drive_c", "users", "steamuser", "AppData", "Roaming"),
+    'LOCALAPPDATA': os.path.join("pfx", "drive_c", "users", "steamuser", "AppData", "Local"),
+    'USERPROFILE': os.path.join("pfx", "drive_c", "users", "steamuser"),
+}
+_WINE_VAR_PREFIXES = tuple(f"%{name}%" for name in _WINE_VAR_DIRS)
+
+# Steam library compatdata paths used when none are given on the command line
+DEFAULT_STEAM_LIBRARIES = (
+    "/home/omustardo/ssd/SteamLibrary/steamapps/compatdata/",
+    "/home/omustardo/.steam/debian-installation/steamapps/compatdata/"
+)
+
+def _safe_mtime(path):
+    """Get a path's modification time, or None if it can't be read"""
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+# Start of the save game section: a span whose id mentions both "save" and "game"
+# (matched against the raw page bytes, so nothing has to be decoded to find it)
+_SAVE_SECTION_RE = re.compile(
+    rb"""<span\b[^>]*\sid=["'](?P<id>[^"']*(?:save[^"']*game|game[^"']*save)[^"']*)""", re.IGNORECASE)
+_TABLE_END_RE = re.compile(rb'</table', re.IGNORECASE)
+
+# Rows and data cells of the save game table, and any markup inside a cell
+_TABLE_ROW_RE = re.compile(r'<tr\b[^>]*>(.*?)</tr\s*>', re.IGNORECASE | re.DOTALL)
+_TABLE_CELL_RE = re.compile(r'<td\b[^>]*>(.*?)</td\s*>', re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r'<[^>]*>')
+
+def _save_path_from_row(row):
+    """Get the Windows save path from a row of the save game table, if it has one"""
+    # Check if this is a single-column table with just the path
+    if len(row) == 1:
+        path = row[0]
+        log.debug("Single column path: '%s'", path)
+        if path and not path.startswith("N/A") and ("%" in path or "steamapps" in path):
+            path = path.replace("&lt;", "<").replace("&gt;", ">")
+            
+            # If path ends with a filename, get the directory
+            if "\\" in path and not path.endswith("\\"):
+                # Check if last part looks like a filename
+                last_part = path.split("\\")[-1]
+                if "." in last_part and not last_part.startswith("."):
+                    path = "\\".join(path.split("\\")[:-1])
+                    log.debug("Removed filename, using directory: %s", path)
+            
+            return path
+    
+    # Check traditional two-column format (system, path)
+    elif len(row) >= 2:
+        system = row[0].lower()
+        path = row[1]
+        
+        log.debug("Row system: '%s', path: '%s'", system, path)
+        
+        if ("windows" in system or "steam" in system) and path:
+            # Clean up the path
+            path = path.replace("&lt;", "<").replace("&gt;", ">")
+            if not path.startswith("N/A"):
+                return path
+    
+    return None
+
+def parse_save_locations(chunks):
+    """Extract save game locations from a PC Gaming Wiki page, given as an iterable of byte chunks"""
+    section = None
+    pending = b""
+    for chunk in chunks:
+        if section is None:
+            # Nothing before the save game section matters, so only keep looking for its start
+            pending += chunk
+            match = _SAVE_SECTION_RE.search(pending)
+            if not match:
+                pending = pending[-1024:]  # Keep the tail in case the section tag spans chunks
+                continue
+            log.debug("Found save section: %s", match.group('id').decode('utf-8', errors='ignore'))
+            section = pending[match.start():]
+            scanned = 0
+        else:
+            section += chunk
+        
+        # The save game table is all that's needed, so stop reading once it has closed
+        table_end = _TABLE_END_RE.search(section, scanned)
+        if table_end:
+            section = section[:table_end.start()]
+            break
+        scanned = max(0, len(section) - len(b'</table'))
+    
+    if section is None:
+        return []  # Many pages have no save game section; those are never decoded
+    
+    # Only the save section itself is decoded
+    section = section.decode('utf-8', errors='ignore')
+    save_locations = []
+    for row_html in _TABLE_ROW_RE.findall(section):
+        row = [unescape(_TAG_RE.sub('', cell)).strip() for cell in _TABLE_CELL_RE.findall(row_html)]
+        log.debug("Processing table row: %s", row)
+        path = _save_path_from_row(row)
+        if path:
+            log.debug("Adding save location: %s", path)
+            save_locations.append(path)
+    return save_locations
+
+def _iter_response(response, chunk_size=8192):
+    """Iterate over a response body one chunk of bytes at a time, decompressing it if gzipped"""
+    chunks = iter(functools.partial(response.read, chunk_size), b"")
+    if (response.getheader('Content-Encoding') or '').lower() == 'gzip':
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)  # Expect a gzip header
+        chunks = map(decompressor.decompress, chunks)
+    return chunks
 
 class SteamGameFinder:
     def __init__(self, steam_libraries=None):
@@ -117,19 +174,49 @@ class SteamGameFinder:
         self.root.geometry("900x700")
         
         # Steam library paths (from CLI args or defaults)
-        self.steam_libraries = steam_libraries or [
-            "/home/omustardo/ssd/SteamLibrary/steamapps/compatdata/",
-            "/home/omustardo/.steam/debian-installation/steamapps/compatdata/"
-        ]
-        
-        # Cache for Steam app list
-        self.steam_apps = []
-        self.cache_file = os.path.expanduser("~/.cache/steam_apps.json")
+        self.steam_libraries = list(steam_libraries or DEFAULT_STEAM_LIBRARIES)
+        
+        # Steam app list, stored as parallel lists indexed by position:
+        # display names, pre-lowercased names for searching, and app IDs
+        self._names = []
+        self._names_lower = []
+        self._appids = array('i')
+        self._stale_apps = None  # Expired cache contents, used if the download fails
+        self._download_lock = threading.Lock()  # Held while an app list download is running
+        self.cache_file = os.path.expanduser("~/.cache/steam_apps.pkl")
+        self.wiki_cache_dir = os.path.expanduser("~/.cache/steam_folder_finder/wiki")
+        self._wiki_cache = {}  # Wiki lookups already read from or written to disk, by URL
+        self._bases = {}  # Wiki path variable -> prefix folder, for each compatdata path seen
+        
         self.current_wiki_url = ""
         self.wiki_link_label = None  # Initialize to prevent AttributeError
         
+        # App IDs mapped to their compatdata folders (with the library mtimes they were read at),
+        # built lazily by _get_installed_ids(), and the indices of those apps in the app list
+        # (with the map they came from), built by _get_installed_indices()
+        self._installed_ids = None
+        self._installed_idx = None
+        
+        # Pending debounced search (see on_search_changed) and the last query searched
+        self._search_after_id = None
+        self._last_query = None
+        
+        # (app ID, name) for each row in the results list
+        self._current_matches = []
+        
+        # Whether each library path exists, and the ones that are symlinked copies of
+        # an earlier library (skipped when scanning), filled in by _probe_libs
+        self._lib_ok = {}
+        self._lib_aliases = set()
+        
+        # Bumped on every folder search so results from a superseded scan are dropped
+        self._folder_scan_id = 0
+        
         self.setup_ui()
         self.load_steam_apps()
+        
+        # Check library paths off the UI thread; a sleeping disk or network share can take a while
+        threading.Thread(target=self._probe_libs, daemon=True).start()
     
     def setup_ui(self):
         # Main frame
@@ -232,6 +319,36 @@ class SteamGameFinder:
         main_frame.rowconfigure(3, weight=1)
         main_frame.rowconfigure(4, weight=1)
     
+    def _probe_libs(self):
+        """Check which Steam library paths exist (runs in a background thread)"""
+        lib_ok = {lib: os.path.exists(lib) for lib in self.steam_libraries}
+        for lib, ok in lib_ok.items():
+            if not ok:
+                log.warning("Steam library not found: %s", lib)
+        
+        # Resolve symlinks here rather than at startup, so the same library given twice is scanned once
+        real_libs = {}
+        aliases = set()
+        for lib in self.steam_libraries:
+            if lib_ok[lib]:
+                real = os.path.realpath(lib)
+                if real in real_libs:
+                    log.info("Steam library %s is the same as %s", lib, real_libs[real])
+                    aliases.add(lib)
+                else:
+                    real_libs[real] = lib
+        self.root.after(0, lambda: self._show_lib_status(lib_ok, aliases))
+    
+    def _show_lib_status(self, lib_ok, aliases):
+        """Store library probe results and grey out missing and duplicate paths"""
+        self._lib_ok = lib_ok
+        self._lib_aliases = aliases
+        if aliases:
+            self._installed_ids = None  # May have been built with the duplicates included
+        for index, lib in enumerate(self.steam_libraries):
+            if not lib_ok[lib] or lib in aliases:
+                self.libs_listbox.itemconfig(index, foreground="gray")
+    
     def load_steam_apps(self):
         """Load Steam app list from cache or download from Steam API"""
         self.status_var.set("Loading Steam game list...")
@@ -239,18 +356,34 @@ class SteamGameFinder:
         # Try to load from cache first
         if os.path.exists(self.cache_file):
             try:
-                with open(self.cache_file, 'r') as f:
-                    data = json.load(f)
+                with open(self.cache_file, 'rb') as f:
+                    data = pickle.load(f)
+                    apps = (data['names'], data['names_lower'], data['appids'])
                     # Check if cache is less than 7 days old
-                    if time.time() - data.get('timestamp', 0) < 7 * 24 * 3600:
-                        self.steam_apps = data['apps']
-                        self.status_var.set(f"Loaded {len(self.steam_apps)} games from cache")
+                    if time.time() - data.get('ts', 0) < 7 * 24 * 3600:
+                        self._install_apps(*apps, status=f"Loaded {len(apps[0])} games from cache")
                         return
-            except (json.JSONDecodeError, KeyError):
-                pass
+                    # Keep the expired list around in case the download fails
+                    self._stale_apps = apps
+            except Exception as e:
+                # A damaged cache can fail in many ways; any of them just means downloading again
+                log.warning("Could not read Steam app cache %s: %s: %s", self.cache_file, type(e).__name__, e)
         
         # Download from Steam API in background
-        threading.Thread(target=self.download_steam_apps, daemon=True).start()
+        self._start_download()
+    
+    def _start_download(self):
+        """Download the app list on a background thread, unless a download is already running"""
+        if not self._download_lock.acquire(blocking=False):
+            return
+        
+        def download():
+            try:
+                self.download_steam_apps()
+            finally:
+                self._download_lock.release()
+        
+        threading.Thread(target=download, daemon=True).start()
     
     def download_steam_apps(self):
         """Download Steam app list from Steam Web API"""
@@ -259,101 +392,189 @@ class SteamGameFinder:
             
             url = "https://api.steampowered.com/ISteamApps/GetAppList/v2/"
             
+            # Parse straight from the response rather than holding a second copy of the body
             with urllib.request.urlopen(url, timeout=30) as response:
-                data = json.loads(response.read().decode())
-                
-            apps = data['applist']['apps']
+                data = json.load(response)
             
             # Filter out non-games (rough heuristic: games usually have longer names)
-            filtered_apps = [app for app in apps if len(app['name']) > 3 and not app['name'].startswith('Steamworks')]
+            filtered_apps = [app for app in data['applist']['apps']
+                             if len(app['name']) > 3 and not app['name'].startswith('Steamworks')]
+            del data  # Drop the unfiltered list before building the search lists
             
-            self.steam_apps = filtered_apps
+            # Build the search lists here, then hand them to the Tk thread in one step
+            names, names_lower, appids = self._build_soa(filtered_apps)
+            del filtered_apps
+            self._stale_apps = None
+            self.root.after(0, lambda: self._install_apps(
+                names, names_lower, appids, status=f"Downloaded {len(names)} games"))
             
-            # Cache the results
+            # Cache the already-processed lists so startup doesn't have to re-parse JSON
             os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
             cache_data = {
-                'timestamp': time.time(),
-                'apps': self.steam_apps
+                'ts': time.time(),
+                'names': names,
+                'names_lower': names_lower,
+                'appids': appids
             }
-            with open(self.cache_file, 'w') as f:
-                json.dump(cache_data, f)
+            # Write a temporary file and swap it in, so quitting mid-write can't leave a truncated cache
+            tmp_file = f"{self.cache_file}.{os.getpid()}.tmp"
+            with open(tmp_file, 'wb') as f:
+                pickle.dump(cache_data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, self.cache_file)
             
-            self.root.after(0, lambda: self.status_var.set(f"Downloaded {len(self.steam_apps)} games"))
+            # Remove the much larger JSON cache written by older versions
+            legacy_cache = os.path.expanduser("~/.cache/steam_apps.json")
+            if os.path.exists(legacy_cache):
+                os.remove(legacy_cache)
             
         except Exception as e:
+            log.warning("Error downloading Steam apps: %s", e)
+            stale_apps = self._stale_apps
+            if stale_apps:
+                # Better to search an old list than nothing at all
+                status = f"Offline: using cached {len(stale_apps[0])} games ({type(e).__name__})"
+                self.root.after(0, lambda: self._install_apps(*stale_apps, status=status))
+                return
             error_msg = f"Failed to download game list: {str(e)}"
             self.root.after(0, lambda: self.status_var.set(error_msg))
-            print(f"Error downloading Steam apps: {e}")
+    
+    def _build_soa(self, apps):
+        """Convert the app list into parallel name/lowercase name/appid lists for fast searching"""
+        # Intern names so duplicates, and names that are already lowercase, share one
+        # string object (pickle keeps that sharing when the cache is reloaded)
+        intern = sys.intern
+        names = [intern(name) if len(name) < 80 else name for name in (app['name'] for app in apps)]
+        names_lower = [intern(lower) if len(lower) < 80 else lower for lower in (name.lower() for name in names)]
+        return names, names_lower, array('i', (app['appid'] for app in apps))
+    
+    def _install_apps(self, names, names_lower, appids, status=None):
+        """Swap in new app lists for searching (must run on the Tk thread)"""
+        self._names, self._names_lower, self._appids = names, names_lower, appids
+        self._installed_idx = None
+        if status:
+            self.status_var.set(status)
+        
+        # Re-run the current search, if any, against the new list
+        self._last_query = None
+        if self.search_var.get().strip():
+            self._do_search()
     
     def refresh_steam_apps(self):
         """Force refresh of Steam app list"""
+        if self._download_lock.locked():
+            return  # A fresh list is already on its way
         if os.path.exists(self.cache_file):
             os.remove(self.cache_file)
-        self.steam_apps = []
+        if self._names:
+            self._stale_apps = (self._names, self._names_lower, self._appids)
+        self._installed_ids = None
+        self._install_apps([], [], array('i'))
+        self._current_matches = []
         self.results_listbox.delete(0, tk.END)
-        threading.Thread(target=self.download_steam_apps, daemon=True).start()
+        self._start_download()
     
     def on_search_changed(self, event=None):
-        """Handle search input changes"""
+        """Handle search input changes (debounced so bursts of keystrokes run one search)"""
+        if self._search_after_id:
+            self.root.after_cancel(self._search_after_id)
+        self._search_after_id = self.root.after(120, self._do_search)
+    
+    def _do_search(self):
+        """Run the search for the current query and fill the results list"""
+        self._search_after_id = None
         query = self.search_var.get().strip()
+        if query == self._last_query:
+            return
+        self._last_query = query
+        
         if len(query) < 2:
+            self._current_matches = []
             self.results_listbox.delete(0, tk.END)
             return
         
-        # Fuzzy search through steam apps
-        matches = self.fuzzy_search(query, self.steam_apps)
-        
-        # Filter by installed games (always enabled now)
-        matches = self.filter_installed_games(matches)
+        # Fuzzy search through installed games only (always enabled now); filtering
+        # first means only a few hundred names are scored instead of the whole list
+        matches = self.fuzzy_search(query, self._get_installed_indices(), limit=50)  # Limit to 50 results
         
+        self._current_matches = [(self._appids[i], self._names[i]) for i in matches]
+        items = [f"{app_name} (ID: {app_id})" for app_id, app_name in self._current_matches]
         self.results_listbox.delete(0, tk.END)
-        for app in matches[:50]:  # Limit to 50 results
-            self.results_listbox.insert(tk.END, f"{app['name']} (ID: {app['appid']})")
+        self.results_listbox.insert(tk.END, *items)  # One Tcl call for all rows
     
-
+    def _library_mtimes(self):
+        """Get the mtime of each Steam library, which changes when a game's folder is added or removed"""
+        mtimes = []
+        for library in self.steam_libraries:
+            try:
+                mtimes.append(os.stat(library).st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+        return tuple(mtimes)
     
-    def filter_installed_games(self, games):
-        """Filter games to only those that have compatdata folders (i.e., are installed)"""
-        installed_games = []
-        
-        for game in games:
-            app_id = str(game['appid'])
-            
-            # Check if this game has a compatdata folder in any Steam library
-            for library in self.steam_libraries:
-                compatdata_path = os.path.join(library, app_id)
-                if os.path.exists(compatdata_path):
-                    installed_games.append(game)
-                    break  # Found in one library, no need to check others
-        
-        return installed_games
+    def _get_installed_ids(self):
+        """Map app IDs to their compatdata folders across all Steam libraries (cached until one changes)"""
+        # A stat per library is enough to notice games installed while the app is open
+        mtimes = self._library_mtimes()
+        cached = self._installed_ids  # Read once: the Tk thread may reset it while this runs
+        if cached is not None and cached[0] == mtimes:
+            return cached[1]
+        
+        # One scandir per library instead of a stat per candidate game
+        ids = {}
+        for library in self.steam_libraries:
+            if library in self._lib_aliases:
+                continue
+            try:
+                with os.scandir(library) as entries:
+                    for e in entries:
+                        if e.name.isdigit() and e.is_dir():
+                            ids.setdefault(e.name, []).append(e.path)
+            except OSError:
+                pass
+        self._installed_ids = (mtimes, ids)
+        return ids
     
-    def fuzzy_search(self, query, apps):
-        """Simple fuzzy search implementation"""
+    def _get_installed_indices(self):
+        """Get indices of apps that have compatdata folders (i.e., are installed), cached"""
+        installed_ids = self._get_installed_ids()
+        cached = self._installed_idx
+        if cached is None or cached[0] is not installed_ids:
+            appids = {int(app_id) for app_id in installed_ids}
+            cached = self._installed_idx = (installed_ids,
+                                            [i for i, app_id in enumerate(self._appids) if app_id in appids])
+        return cached[1]
+    
+    def fuzzy_search(self, query, candidates=None, limit=50):
+        """Simple fuzzy search implementation, returning the best `limit` app indices by relevance"""
         query_lower = query.lower()
+        names_lower = self._names_lower
+        if candidates is None:
+            candidates = range(len(names_lower))
         matches = []
         
-        for app in apps:
-            name_lower = app['name'].lower()
-            if query_lower in name_lower:
-                # Calculate relevance score
-                score = 0
-                if name_lower.startswith(query_lower):
-                    score += 100  # Exact start match
+        for i in candidates:
+            name_lower = names_lower[i]
+            idx = name_lower.find(query_lower)
+            if idx < 0:
+                continue
+            
+            # Calculate relevance score
+            score = 0
+            if idx == 0:
+                score += 100  # Exact start match
                 if query_lower == name_lower:
                     score += 200  # Exact match
-                
-                # Add word boundary bonus
-                words = name_lower.split()
-                for word in words:
-                    if word.startswith(query_lower):
-                        score += 50
-                
-                matches.append((score, app))
+            
+            # Add word boundary bonus for each word starting with the query
+            while idx >= 0:
+                if idx == 0 or name_lower[idx - 1] == ' ':
+                    score += 50
+                idx = name_lower.find(query_lower, idx + 1)
+            
+            matches.append((score, i))
         
-        # Sort by relevance score (descending)
-        matches.sort(key=lambda x: x[0], reverse=True)
-        return [app for score, app in matches]
+        # Pick the most relevant matches without sorting all of them (ties keep list order)
+        return [i for score, i in heapq.nlargest(limit, matches, key=lambda x: x[0])]
     
     def on_game_selected(self, event=None):
         """Handle game selection - automatically find folders"""
@@ -369,14 +590,8 @@ class SteamGameFinder:
             messagebox.showwarning("No Selection", "Please select a game from the list.")
             return
         
-        # Extract app ID from selection
-        selected_text = self.results_listbox.get(selection[0])
-        try:
-            app_id = int(selected_text.split("ID: ")[1].rstrip(")"))
-            app_name = selected_text.split(" (ID:")[0]
-        except (IndexError, ValueError):
-            messagebox.showerror("Error", "Could not parse selected game ID.")
-            return
+        # Look up the app ID and name for the selected row
+        app_id, app_name = self._current_matches[selection[0]]
         
         self.status_var.set(f"Searching for {app_name} folders...")
         
@@ -384,150 +599,213 @@ class SteamGameFinder:
         for item in self.results_tree.get_children():
             self.results_tree.delete(item)
         
-        found_folders = []
-        
-        # First, try to get save locations from PC Gaming Wiki
-        wiki_paths = self.get_save_paths_from_wiki(app_name)
-        
         # Update wiki link in UI
         wiki_url = self.game_name_to_wiki_url(app_name)
         if self.wiki_link_label:  # Check if UI is initialized
             self.wiki_link_label.config(text=f"PC Gaming Wiki: {app_name}")
         self.current_wiki_url = wiki_url
         
-        # Check each Steam library
-        for library in self.steam_libraries:
-            compatdata_path = os.path.join(library, str(app_id))
+        # Scan in the background so the UI stays responsive on slow or large folders
+        self._folder_scan_id += 1
+        threading.Thread(target=self._find_folders_bg, args=(app_id, app_name, self._folder_scan_id),
+                         daemon=True).start()
+    
+    def _find_folders_bg(self, app_id, app_name, scan_id):
+        """Scan for a game's folders off the UI thread, then hand the results to _populate_tree"""
+        try:
+            results = self._collect_folders(app_id, app_name)
+        except Exception as e:
+            # Still report back, or the UI would be left saying it is searching
+            log.warning("Folder search for %s failed: %s: %s", app_name, type(e).__name__, e)
+            self.root.after(0, self._populate_tree, [], app_name, scan_id, e)
+            return
+        self.root.after(0, self._populate_tree, results, app_name, scan_id)
+    
+    def _collect_folders(self, app_id, app_name):
+        """Find a game's folders, as (display text, path) pairs in priority order"""
+        found_folders = []
+        
+        # Get game name variations for matching (shared by every folder scan)
+        game_words = self.extract_game_keywords(app_name)
+        
+        # Gather candidate locations in each Steam library the game is installed in
+        library_locations = []
+        for compatdata_path in self._get_installed_ids().get(str(app_id), ()):
+            steamuser = os.path.join(compatdata_path, "pfx", "drive_c", "users", "steamuser")
             
-            if os.path.exists(compatdata_path):
-                # Try wiki paths first
-                for wiki_path in wiki_paths:
-                    wiki_folders = self.check_wiki_path(compatdata_path, wiki_path, app_name)
-                    found_folders.extend(wiki_folders)
-                
-                # Then check all AppData locations with heuristics
-                appdata_paths = [
-                    ("AppData/Local", os.path.join(compatdata_path, "pfx", "drive_c", "users", "steamuser", "AppData", "Local")),
-                    ("AppData/Roaming", os.path.join(compatdata_path, "pfx", "drive_c", "users", "steamuser", "AppData", "Roaming")),
-                    ("AppData/LocalLow", os.path.join(compatdata_path, "pfx", "drive_c", "users", "steamuser", "AppData", "LocalLow"))
-                ]
-                
-                for appdata_type, base_path in appdata_paths:
-                    if os.path.exists(base_path):
-                        # Show the base AppData folder
-                        found_folders.append((appdata_type, base_path))
-                        
-                        # Look for game-specific folders in this AppData directory
-                        self.find_game_folders(base_path, app_name, appdata_type, found_folders)
-                
-                # Also check some other common locations
-                other_paths = [
-                    ("Documents", os.path.join(compatdata_path, "pfx", "drive_c", "users", "steamuser", "Documents")),
-                    ("My Games", os.path.join(compatdata_path, "pfx", "drive_c", "users", "steamuser", "Documents", "My Games")),
-                    ("Saved Games", os.path.join(compatdata_path, "pfx", "drive_c", "users", "steamuser", "Saved Games"))
-                ]
-                
-                for location_type, path in other_paths:
-                    if os.path.exists(path):
-                        found_folders.append((location_type, path))
-                        self.find_game_folders(path, app_name, location_type, found_folders)
-        
-        # Add results to tree (sort by priority)
-        if found_folders:
-            # Sort folders by priority: Likely Save Folders first, then by modification time
-            def get_folder_priority(folder_item):
-                folder_type, path = folder_item
-                priority = 0
-                
-                # Highest priority for likely save folders
-                if "Likely Save Folder" in folder_type:
-                    priority += 1000
-                elif "Game Folder" in folder_type:
-                    priority += 100
-                elif "Potential" in folder_type:
-                    priority += 50
-                
-                # Add recent modification bonus
-                try:
-                    mtime = os.path.getmtime(path)
-                    days_old = (time.time() - mtime) / (24 * 3600)
-                    if days_old < 1:  # Modified in last day
-                        priority += 20
-                    elif days_old < 7:  # Modified in last week
-                        priority += 10
-                    elif days_old < 30:  # Modified in last month
-                        priority += 5
-                except (OSError, PermissionError):
-                    pass
-                
-                return -priority  # Negative for descending sort
+            # AppData locations, plus some other common locations
+            locations = [
+                ("AppData/Local", f"{steamuser}/AppData/Local"),
+                ("AppData/Roaming", f"{steamuser}/AppData/Roaming"),
+                ("AppData/LocalLow", f"{steamuser}/AppData/LocalLow"),
+                ("Documents", f"{steamuser}/Documents"),
+                ("My Games", f"{steamuser}/Documents/My Games"),
+                ("Saved Games", f"{steamuser}/Saved Games")
+            ]
+            library_locations.append((compatdata_path, locations))
+        
+        # Get save locations from PC Gaming Wiki while the local folders are scanned
+        wiki_job = self._fetch_wiki_in_background(app_name)
+        
+        # Probe and scan all locations concurrently, so filesystem latency
+        # (e.g. on network mounts) overlaps instead of adding up
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            paths = [path for _, locations in library_locations for _, path in locations]
+            exists = dict(zip(paths, executor.map(os.path.exists, paths)))
             
-            found_folders.sort(key=get_folder_priority)
+            library_jobs = []
+            for compatdata_path, locations in library_locations:
+                # Check each location with heuristics
+                jobs = [executor.submit(self._scan_location, location_type, path, app_name, game_words)
+                        for location_type, path in locations if exists[path]]
+                library_jobs.append((compatdata_path, jobs))
             
-            for folder_type, path in found_folders:
-                # Add modification time info for better context
-                try:
-                    mtime = os.path.getmtime(path)
-                    days_old = (time.time() - mtime) / (24 * 3600)
-                    if days_old < 1:
-                        time_info = " (modified today)"
-                    elif days_old < 7:
-                        time_info = f" (modified {int(days_old)} days ago)"
-                    elif days_old < 30:
-                        time_info = f" (modified {int(days_old)} days ago)"
-                    else:
-                        time_info = ""
-                except (OSError, PermissionError):
-                    time_info = ""
-                
-                display_text = f"{folder_type}: {os.path.basename(path)}{time_info}"
-                item = self.results_tree.insert("", tk.END, text=display_text)
-                self.results_tree.set(item, "path", path)
+            library_folders = [(compatdata_path, [folder for job in jobs for folder in job.result()])
+                               for compatdata_path, jobs in library_jobs]
+            
+            # Use the wiki paths whenever they are already in (e.g. from the cache), and
+            # only skip waiting on the network if the heuristics already found the saves
+            if wiki_job.done() or not any("Likely Save Folder" in folder_type
+                                          for _, folders in library_folders for folder_type, _, _ in folders):
+                wiki_paths = list(dict.fromkeys(wiki_job.result()))  # Probe each path once
+            else:
+                wiki_paths = []
+            
+            # Then check the wiki paths in each library, listing them first. Folders the
+            # heuristics already found are known to exist, along with their mtimes
+            scanned = {path: mtime for _, folders in library_folders for _, path, mtime in folders}
+            for compatdata_path, folders in library_folders:
+                wiki_jobs = [executor.submit(self.check_wiki_path, compatdata_path, wiki_path, app_name, scanned)
+                             for wiki_path in wiki_paths]
+                for job in wiki_jobs:
+                    found_folders.extend(job.result())
+                found_folders.extend(folders)
+        
+        # Sort folders by priority: Likely Save Folders first, then by modification time
+        # (each folder was stat'ed once during the scan, for both sorting and display)
+        now = time.time()
+        
+        def get_folder_priority(folder_item):
+            folder_type, path, mtime = folder_item
+            priority = 0
+            
+            # Highest priority for likely save folders
+            if "Likely Save Folder" in folder_type:
+                priority += 1000
+            elif "Game Folder" in folder_type:
+                priority += 100
+            elif "Potential" in folder_type:
+                priority += 50
+            
+            # Add recent modification bonus
+            if mtime is not None:
+                days_old = (now - mtime) / (24 * 3600)
+                if days_old < 1:  # Modified in last day
+                    priority += 20
+                elif days_old < 7:  # Modified in last week
+                    priority += 10
+                elif days_old < 30:  # Modified in last month
+                    priority += 5
             
-            self.status_var.set(f"Found {len(found_folders)} folders for {app_name}")
+            return -priority  # Negative for descending sort
+        
+        found_folders.sort(key=get_folder_priority)
+        
+        results = []
+        for folder_type, path, mtime in found_folders:
+            # Add modification time info for better context
+            time_info = ""
+            if mtime is not None:
+                days_old = (now - mtime) / (24 * 3600)
+                if days_old < 1:
+                    time_info = " (modified today)"
+                elif days_old < 7:
+                    time_info = f" (modified {int(days_old)} days ago)"
+                elif days_old < 30:
+                    time_info = f" (modified {int(days_old)} days ago)"
+            
+            results.append((f"{folder_type}: {os.path.basename(path)}{time_info}", path))
+        
+        return results
+    
+    def _populate_tree(self, results, app_name, scan_id, error=None):
+        """Show folder search results (runs on the UI thread)"""
+        if scan_id != self._folder_scan_id:
+            return  # Another game was selected while this scan ran
+        
+        if error is not None:
+            self.results_tree.insert("", tk.END, text="No folders found")
+            self.status_var.set(f"Folder search failed for {app_name}: {error}")
+        elif results:
+            for display_text, path in results:
+                self.results_tree.insert("", tk.END, text=display_text, values=(path,))
+            
+            self.status_var.set(f"Found {len(results)} folders for {app_name}")
         else:
             self.results_tree.insert("", tk.END, text="No folders found")
             self.status_var.set(f"No folders found for {app_name}")
     
-    def find_game_folders(self, base_path, app_name, location_type, found_folders):
+    def _fetch_wiki_in_background(self, app_name):
+        """Start a wiki lookup on a daemon thread and return a Future for its save paths"""
+        # Not a pool worker: those are joined at exit, so a slow fetch would keep the app open
+        future = Future()
+        
+        def fetch():
+            try:
+                future.set_result(self.get_save_paths_from_wiki(app_name))
+            except Exception as e:
+                future.set_exception(e)
+        
+        threading.Thread(target=fetch, daemon=True).start()
+        return future
+    
+    def _scan_location(self, location_type, path, app_name, game_words):
+        """List a save location along with any game-specific folders inside it"""
+        found_folders = [(location_type, path, _safe_mtime(path))]
+        self.find_game_folders(path, app_name, game_words, location_type, found_folders)
+        return found_folders
+    
+    def find_game_folders(self, base_path, app_name, game_words, location_type, found_folders):
         """Look for game-specific folders with smart pattern matching"""
         try:
-            # Get game name variations for matching
-            game_words = self.extract_game_keywords(app_name)
-            
-            for item in os.listdir(base_path):
-                item_path = os.path.join(base_path, item)
-                if os.path.isdir(item_path):
-                    # Check if folder name matches game patterns
-                    match_score = self.calculate_folder_match_score(item, game_words, app_name)
+            with os.scandir(base_path) as entries:
+                subdirs = [entry for entry in entries
+                           if entry.name not in _IGNORED_APPDATA_DIRS and entry.is_dir()]
+            
+            for entry in subdirs:
+                item_path = entry.path
+                # Check if folder name matches game patterns
+                match_score = self.calculate_folder_match_score(entry.name, game_words, app_name)
+                
+                if match_score > 0:
+                    # Check if this folder contains save-like files
+                    save_confidence = self.assess_save_folder_confidence(item_path)
                     
-                    if match_score > 0:
-                        # Check if this folder contains save-like files
-                        save_confidence = self.assess_save_folder_confidence(item_path)
+                    if save_confidence > 0:
+                        folder_desc = f"Game Folder ({location_type})"
+                        if save_confidence >= 2:
+                            folder_desc = f"Likely Save Folder ({location_type})"
                         
-                        if save_confidence > 0:
-                            folder_desc = f"Game Folder ({location_type})"
-                            if save_confidence >= 2:
-                                folder_desc = f"Likely Save Folder ({location_type})"
-                            
-                            found_folders.append((folder_desc, item_path))
-                        else:
-                            # Still add it as a potential folder if name match is strong
-                            if match_score >= 3:
-                                found_folders.append((f"Potential Game Folder ({location_type})", item_path))
+                        found_folders.append((folder_desc, item_path, _safe_mtime(item_path)))
+                    else:
+                        # Still add it as a potential folder if name match is strong
+                        if match_score >= 3:
+                            found_folders.append((f"Potential Game Folder ({location_type})", item_path,
+                                                  _safe_mtime(item_path)))
         
-        except PermissionError:
+        except OSError:  # Unreadable, or gone/unreachable (e.g. a dropped network mount)
             pass
     
-    def extract_game_keywords(self, app_name):
-        """Extract meaningful keywords from game name for matching"""
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def extract_game_keywords(app_name):
+        """Extract meaningful keywords from game name for matching (memoized per name)"""
         # Remove common words and split
         common_words = {'the', 'and', 'or', 'of', 'a', 'an', 'in', 'on', 'at', 'to', 'for', 'with', 'by'}
         words = []
         
         # Split by common delimiters
-        import re
-        parts = re.split(r'[:\-\s\(\)]+', app_name.lower())
+        parts = _SPLIT_RE.split(app_name.lower())
         
         for part in parts:
             part = part.strip()
@@ -542,7 +820,14 @@ class SteamGameFinder:
             if word.endswith('s') and len(word) > 3:
                 variations.append(word[:-1])  # Remove plural 's'
         
-        return list(set(variations))  # Remove duplicates
+        return tuple(set(variations))  # Remove duplicates; a tuple since the result is shared
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _keyword_matchers(game_words):
+        """Build the game word set and a regex matching any game word or folder pattern (memoized)"""
+        keyword_re = re.compile('|'.join(re.escape(word) for word in (*game_words, *_GAME_FOLDER_PATTERNS)))
+        return frozenset(game_words), keyword_re
     
     def calculate_folder_match_score(self, folder_name, game_words, full_game_name):
         """Calculate how likely a folder is related to the game"""
@@ -553,9 +838,14 @@ class SteamGameFinder:
         if folder_lower == full_game_name.lower():
             return 10
         
+        # Every check below needs a game word or folder pattern somewhere in the name,
+        # so one regex scan can rule out most folders
+        game_word_set, keyword_re = self._keyword_matchers(game_words)
+        if not keyword_re.search(folder_lower):
+            return 0
+        
         # Check for substantial overlap in words
-        folder_words = set(re.split(r'[:\-\s\(\)]+', folder_lower))
-        game_word_set = set(game_words)
+        folder_words = set(_SPLIT_RE.split(folder_lower))
         
         # Calculate word overlap percentage
         if folder_words and game_word_set:
@@ -573,13 +863,7 @@ class SteamGameFinder:
                     score += 1
         
         # Check for common game folder patterns
-        game_patterns = [
-            'save', 'saves', 'savegame', 'savegames', 'savedata',
-            'config', 'settings', 'profile', 'profiles', 'user',
-            'data', 'game', 'local', 'steam'
-        ]
-        
-        for pattern in game_patterns:
+        for pattern in _GAME_FOLDER_PATTERNS:
             if pattern in folder_lower:
                 score += 1
         
@@ -590,20 +874,22 @@ class SteamGameFinder:
         confidence = 0
         
         try:
-            items = os.listdir(folder_path)
+            with os.scandir(folder_path) as it:
+                entries = list(it)
             recent_activity_bonus = 0
             
             # Check for recent file modifications (within last 30 days)
             current_time = time.time()
             recent_files = 0
+            search_pattern = _SAVE_PATTERN_RE.search
+            search_numbered = _SAVE_NUM_RE.search
             
-            for item in items:
-                item_path = os.path.join(folder_path, item)
-                item_lower = item.lower()
+            for entry in entries:
+                item_lower = entry.name.lower()
                 
-                # Check modification time
+                # Check modification time (DirEntry caches the stat result)
                 try:
-                    mtime = os.path.getmtime(item_path)
+                    mtime = entry.stat().st_mtime
                     days_old = (current_time - mtime) / (24 * 3600)
                     if days_old < 30:  # Modified in last 30 days
                         recent_files += 1
@@ -615,33 +901,25 @@ class SteamGameFinder:
                     pass
                 
                 # Check file extensions
-                save_extensions = ['.sav', '.save', '.dat', '.xml', '.json', '.cfg', '.ini', '.sl2', '.ess', '.bak', '.vdf']
-                save_patterns = ['save', 'profile', 'config', 'settings', 'user', 'slot', 'progress', 'savegame']
-                
-                for ext in save_extensions:
-                    if item_lower.endswith(ext):
-                        confidence += 2
-                        break
+                if item_lower.endswith(_SAVE_EXTS):
+                    confidence += 2
                 
                 # Check file name patterns
-                for pattern in save_patterns:
-                    if pattern in item_lower:
-                        confidence += 1
-                        break
+                if search_pattern(item_lower):
+                    confidence += 1
                 
                 # Check for numbered save files (save01, slot1, etc.)
-                import re
-                if re.search(r'(save|slot|profile)\d+', item_lower):
+                if search_numbered(item_lower):
                     confidence += 2
             
             # Add recent activity bonus
             confidence += min(recent_activity_bonus, 5)  # Cap the bonus
             
             # Bonus for reasonable number of files with recent activity
-            if 0 < len(items) < 50 and recent_files > 0:
+            if 0 < len(entries) < 50 and recent_files > 0:
                 confidence += 2
                 
-        except PermissionError:
+        except OSError:
             pass
         
         return min(confidence, 10)  # Cap at 10
@@ -664,92 +942,142 @@ class SteamGameFinder:
         
         return f"https://www.pcgamingwiki.com/wiki/{name}"
     
+    def _wiki_cache_path(self, url):
+        """Get the cache file for a wiki URL"""
+        return os.path.join(self.wiki_cache_dir, hashlib.sha1(url.encode()).hexdigest() + ".json")
+    
+    def _load_wiki_cache(self, url):
+        """Load the cached wiki lookup for a URL, or None if there isn't one"""
+        # Games looked at earlier in this session skip the disk as well
+        if url in self._wiki_cache:
+            return self._wiki_cache[url]
+        try:
+            with open(self._wiki_cache_path(url), 'r') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or not isinstance(entry.get('save_paths'), list):
+            return None  # Not written by this version; fetch the page again
+        self._wiki_cache[url] = entry
+        return entry
+    
+    def _save_wiki_cache(self, url, entry):
+        """Store a wiki lookup so repeat lookups can skip the network"""
+        self._wiki_cache[url] = entry
+        try:
+            os.makedirs(self.wiki_cache_dir, exist_ok=True)
+            with open(self._wiki_cache_path(url), 'w') as f:
+                json.dump(entry, f)
+        except OSError as e:
+            log.debug("Could not write wiki cache: %s", e)
+    
     def get_save_paths_from_wiki(self, game_name):
-        """Get save game paths from PC Gaming Wiki"""
+        """Get save game paths from PC Gaming Wiki (runs on a worker thread, so no UI access)"""
+        url = self.game_name_to_wiki_url(game_name)
+        cached = None
+        
         try:
-            url = self.game_name_to_wiki_url(game_name)
-            print(f"[DEBUG] Trying wiki URL: {url}")
-            self.status_var.set(f"Checking PC Gaming Wiki for {game_name}...")
+            # Use the cached result if it is less than 7 days old
+            cached = self._load_wiki_cache(url)
+            if cached and time.time() - cached.get('fetched_at', 0) < 7 * 24 * 3600:
+                log.debug("Using cached wiki save paths for %s: %s", url, cached['save_paths'])
+                return cached['save_paths']
+            
+            log.debug("Trying wiki URL: %s", url)
             
             # Try to fetch the page
-            request = urllib.request.Request(url, headers={
-                'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36'
-            })
+            headers = {
+                'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36',
+                'Accept-Encoding': 'gzip'  # HTML compresses several times over
+            }
+            
+            # Let the server answer 304 Not Modified if the cached page is still current
+            if cached:
+                if cached.get('etag'):
+                    headers['If-None-Match'] = cached['etag']
+                if cached.get('last_modified'):
+                    headers['If-Modified-Since'] = cached['last_modified']
             
+            request = urllib.request.Request(url, headers=headers)
             with urllib.request.urlopen(request, timeout=10) as response:
-                print(f"[DEBUG] Wiki response status: {response.status}")
-                if response.status == 200:
-                    html = response.read().decode('utf-8', errors='ignore')
-                    print(f"[DEBUG] Wiki HTML length: {len(html)} characters")
-                    
-                    # Parse the HTML
-                    parser = PCGamingWikiParser()
-                    parser.feed(html)
-                    
-                    debug_info = parser.get_debug_info()
-                    print(f"[DEBUG] All sections found: {debug_info['sections_found']}")
-                    print(f"[DEBUG] Parser found {len(parser.save_locations)} save locations:")
-                    for i, loc in enumerate(parser.save_locations):
-                        print(f"[DEBUG]   {i+1}: {loc}")
+                log.debug("Wiki response status: %s", response.status)
+                # Parse the HTML as it arrives, stopping once the save table is done
+                save_locations = parse_save_locations(_iter_response(response))
+                
+                log.debug("Parser found %d save locations: %s", len(save_locations), save_locations)
+                
+                self._save_wiki_cache(url, {
+                    'etag': response.getheader('ETag'),
+                    'last_modified': response.getheader('Last-Modified'),
+                    'save_paths': save_locations,
+                    'fetched_at': time.time()
+                })
+                
+                if not save_locations:
+                    log.debug("No save locations found in wiki page")
+                return save_locations
                     
-                    if parser.save_locations:
-                        self.status_var.set(f"Found {len(parser.save_locations)} save paths from wiki")
-                        return parser.save_locations
-                    else:
-                        print(f"[DEBUG] No save locations found in wiki page")
-                        
         except urllib.error.HTTPError as e:
-            print(f"[DEBUG] Wiki HTTP error: {e.code} - {e.reason}")
+            if e.code == 304 and cached:
+                log.debug("Wiki page not modified, using cached save paths")
+                cached['fetched_at'] = time.time()
+                self._save_wiki_cache(url, cached)
+                return cached['save_paths']
+            log.debug("Wiki HTTP error: %s - %s", e.code, e.reason)
         except urllib.error.URLError as e:
-            print(f"[DEBUG] Wiki URL error: {e.reason}")
+            log.debug("Wiki URL error: %s", e.reason)
         except Exception as e:
-            print(f"[DEBUG] Wiki unexpected error: {type(e).__name__}: {e}")
-            
-        print(f"[DEBUG] Wiki lookup failed, falling back to heuristics")
+            log.debug("Wiki unexpected error: %s: %s", type(e).__name__, e)
+        
+        if cached:
+            # Better to check old save paths than none at all
+            log.debug("Wiki lookup failed, using expired cached save paths")
+            return cached['save_paths']
+        log.debug("Wiki lookup failed, falling back to heuristics")
         return []
     
-    def check_wiki_path(self, compatdata_path, wiki_path, game_name):
+    def check_wiki_path(self, compatdata_path, wiki_path, game_name, scanned=None):
         """Check if a wiki path exists in the compatdata structure"""
         found_folders = []
-        print(f"[DEBUG] Checking wiki path: {wiki_path}")
+        log.debug("Checking wiki path: %s", wiki_path)
         
         try:
             # Skip invalid paths
             if "<SteamLibrary-folder>" in wiki_path or "[Note" in wiki_path:
-                print(f"[DEBUG] Skipping placeholder path: {wiki_path}")
+                log.debug("Skipping placeholder path: %s", wiki_path)
                 return found_folders
                 
             # Convert Windows path variables to actual paths
-            if "%APPDATA%" in wiki_path:
-                base_path = os.path.join(compatdata_path, "pfx", "drive_c", "users", "steamuser", "AppData", "Roaming")
-                relative_path = wiki_path.replace("%APPDATA%", "").lstrip("\\").lstrip("/")
-                print(f"[DEBUG] Using APPDATA base: {base_path}")
-            elif "%LOCALAPPDATA%" in wiki_path:
-                base_path = os.path.join(compatdata_path, "pfx", "drive_c", "users", "steamuser", "AppData", "Local")
-                relative_path = wiki_path.replace("%LOCALAPPDATA%", "").lstrip("\\").lstrip("/")
-                print(f"[DEBUG] Using LOCALAPPDATA base: {base_path}")
-            elif "%USERPROFILE%" in wiki_path:
-                base_path = os.path.join(compatdata_path, "pfx", "drive_c", "users", "steamuser")
-                relative_path = wiki_path.replace("%USERPROFILE%", "").lstrip("\\").lstrip("/")
-                print(f"[DEBUG] Using USERPROFILE base: {base_path}")
-            else:
-                print(f"[DEBUG] Skipping unsupported path format: {wiki_path}")
+            if not wiki_path.startswith(_WINE_VAR_PREFIXES):
+                log.debug("Skipping unsupported path format: %s", wiki_path)
                 return found_folders
+            var, _, relative_path = wiki_path[1:].partition("%")
+            bases = self._bases.get(compatdata_path)
+            if bases is None:
+                bases = self._bases[compatdata_path] = {
+                    name: os.path.join(compatdata_path, folder) for name, folder in _WINE_VAR_DIRS.items()}
+            base_path = bases[var]
+            relative_path = relative_path.replace("\\", "/").lstrip("/")  # Windows separators to POSIX
+            log.debug("Using %s base: %s", var, base_path)
             
             if relative_path:
-                # Convert backslashes to forward slashes
-                relative_path = relative_path.replace("\\", "/")
                 full_path = os.path.join(base_path, relative_path)
-                print(f"[DEBUG] Checking full path: {full_path}")
+                log.debug("Checking full path: %s", full_path)
                 
-                if os.path.exists(full_path):
-                    print(f"[DEBUG] ✓ Found wiki path: {full_path}")
-                    found_folders.append(("PC Gaming Wiki Save Location", full_path))
-                else:
-                    print(f"[DEBUG] ✗ Wiki path does not exist: {full_path}")
+                mtime = scanned.get(full_path.rstrip("/")) if scanned else None
+                if mtime is None:
+                    # One stat both checks that the path exists and gets its modification time
+                    try:
+                        mtime = os.stat(full_path).st_mtime
+                    except OSError:
+                        log.debug("✗ Wiki path does not exist: %s", full_path)
+                        return found_folders
+                
+                log.debug("✓ Found wiki path: %s", full_path)
+                found_folders.append(("PC Gaming Wiki Save Location", full_path, mtime))
                     
         except Exception as e:
-            print(f"[DEBUG] Error processing wiki path {wiki_path}: {type(e).__name__}: {e}")
+            log.debug("Error processing wiki path %s: %s: %s", wiki_path, type(e).__name__, e)
             
         return found_folders
     
@@ -766,15 +1094,9 @@ class SteamGameFinder:
             messagebox.showerror("Error", "Selected folder does not exist.")
             return
         
-        try:
-            # Open in file manager
-            subprocess.run(["xdg-open", path], check=True)
-        except subprocess.CalledProcessError:
-            try:
-                # Fallback to nautilus
-                subprocess.run(["nautilus", path], check=True)
-            except subprocess.CalledProcessError:
-                messagebox.showerror("Error", f"Could not open folder: {path}")
+        # Open in file manager, falling back to nautilus
+        if not self._open_externally(path, "nautilus"):
+            messagebox.showerror("Error", f"Could not open folder: {path}")
     
     def on_library_double_click(self, event=None):
         """Handle double-click on library path to open it"""
@@ -784,45 +1106,42 @@ class SteamGameFinder:
         
         path = self.libs_listbox.get(selection[0])
         
-        if not os.path.exists(path):
+        exists = self._lib_ok.get(path)
+        if exists is None:  # Still being probed
+            exists = os.path.exists(path)
+        if not exists:
             messagebox.showerror("Error", f"Library path does not exist: {path}")
             return
         
-        try:
-            # Open in file manager
-            subprocess.run(["xdg-open", path], check=True)
-        except subprocess.CalledProcessError:
-            try:
-                # Fallback to nautilus
-                subprocess.run(["nautilus", path], check=True)
-            except subprocess.CalledProcessError:
-                messagebox.showerror("Error", f"Could not open folder: {path}")
+        # Open in file manager, falling back to nautilus
+        if not self._open_externally(path, "nautilus"):
+            messagebox.showerror("Error", f"Could not open folder: {path}")
     
     def open_wiki_link(self, event=None):
         """Open the PC Gaming Wiki link in browser"""
         if self.current_wiki_url:
+            # Open in browser, falling back to firefox
+            if not self._open_externally(self.current_wiki_url, "firefox"):
+                messagebox.showerror("Error", f"Could not open browser for: {self.current_wiki_url}")
+    
+    def _open_externally(self, target, fallback):
+        """Open a path or URL with xdg-open, or with the fallback program if that can't be started"""
+        for program in ("xdg-open", fallback):
             try:
-                subprocess.run(["xdg-open", self.current_wiki_url], check=True)
-            except subprocess.CalledProcessError:
-                try:
-                    # Fallback to other browsers
-                    subprocess.run(["firefox", self.current_wiki_url], check=True)
-                except subprocess.CalledProcessError:
-                    messagebox.showerror("Error", f"Could not open browser for: {self.current_wiki_url}")
+                # Don't wait for the program to exit, which would freeze the UI meanwhile
+                subprocess.Popen([program, target], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                 start_new_session=True)
+                return True
+            except OSError:
+                pass
+        return False
     
     def select_all_text(self, event=None):
         """Select all text in the search entry"""
-        self.search_entry.select_range(0, tk.END)
+        # Select once Tk is idle rather than from inside the key handler
+        self.search_entry.after_idle(self.search_entry.select_range, 0, tk.END)
         return 'break'  # Prevent default behavior
     
-    def refresh_steam_apps(self):
-        """Force refresh of Steam app list (kept for potential future use)"""
-        if os.path.exists(self.cache_file):
-            os.remove(self.cache_file)
-        self.steam_apps = []
-        self.results_listbox.delete(0, tk.END)
-        threading.Thread(target=self.download_steam_apps, daemon=True).start()
-    
     def open_selected_folder(self):
         """Open the selected folder in file manager"""
         selection = self.results_tree.selection()
@@ -837,15 +1156,9 @@ class SteamGameFinder:
             messagebox.showerror("Error", "Selected folder does not exist.")
             return
         
-        try:
-            # Open in file manager
-            subprocess.run(["xdg-open", path], check=True)
-        except subprocess.CalledProcessError:
-            try:
-                # Fallback to nautilus
-                subprocess.run(["nautilus", path], check=True)
-            except subprocess.CalledProcessError:
-                messagebox.showerror("Error", f"Could not open folder: {path}")
+        # Open in file manager, falling back to nautilus
+        if not self._open_externally(path, "nautilus"):
+            messagebox.showerror("Error", f"Could not open folder: {path}")
     
     def run(self):
         """Start the GUI application"""
@@ -864,17 +1177,26 @@ def main():
              "Default: /home/omustardo/ssd/SteamLibrary/steamapps/compatdata/ and "
              "/home/omustardo/.steam/debian-installation/steamapps/compatdata/"
     )
+    parser.add_argument(
+        "-v", "--verbose",
+        action="store_true",
+        help="Print debug output (wiki lookups, parsing and path checks)"
+    )
     
     args = parser.parse_args()
     
-    # Use provided libraries or fall back to defaults
-    steam_libraries = args.steam_libraries
-    if steam_libraries:
-        # Ensure paths end with compatdata/
-        steam_libraries = [
-            lib if lib.endswith("compatdata/") else lib.rstrip("/") + "/compatdata/"
-            for lib in steam_libraries
-        ]
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.WARNING,
+                        format="[%(levelname)s] %(message)s")
+    
+    # Use provided libraries or fall back to defaults, ensuring paths end with compatdata/.
+    # Paths are normalized so the same library given twice is only listed once
+    steam_libraries = {}
+    for lib in args.steam_libraries or DEFAULT_STEAM_LIBRARIES:
+        lib = lib.rstrip("/")
+        if not lib.endswith("compatdata"):
+            lib += "/compatdata"
+        steam_libraries.setdefault(os.path.join(os.path.normpath(os.path.abspath(lib)), ""), None)
+    steam_libraries = list(steam_libraries)
     
     app = SteamGameFinder(steam_libraries)
     app.run()